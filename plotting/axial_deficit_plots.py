@@ -1,13 +1,15 @@
-from common import get_default_parsing_args, UserOptions, Plot
+from read_simulation_data import clear_simulation_data_cache
+from common import get_default_parsing_args, UserOptions, Plot, \
+    axial_points
 
 
 class AxialDeficitPlot(Plot):
     graph_name = 'axialDeficitPlot_{point}'
 
-    def __init__(self, opts, velocity_component, num_points):
+    def __init__(self, opts, velocity_component, num_points, saver=None):
         super(AxialDeficitPlot, self).__init__(
             AxialDeficitPlot.graph_name, opts,
-            sharey=num_points)
+            sharey=num_points, saver=saver)
         self.velocity_component = velocity_component
 
     def figname(self):
@@ -37,11 +39,13 @@ class AxialDeficitPlot(Plot):
         return (20, 6)
 
 
-def plot(opts):
+def plot(opts, saver=None):
+    # if a saver is supplied (e.g., by plot_all), each velocity component's
+    # figure is saved in the background while the next is read / plotted
     for vc in opts.velocity_component:
-        points = ['0p375', '0p95', '1p53', '3p75', '9p4']
-        adp = AxialDeficitPlot(opts, vc, len(points))
-        for i, point in enumerate(points):
+        adp = AxialDeficitPlot(opts, vc, len(axial_points), saver=saver)
+        adp.prefetch(axial_points, velocity_component=vc)
+        for i, point in enumerate(axial_points):
             adp.plot(point=point, velocity_component=vc, hold=i)
         adp.finalize(point=point)
 
@@ -62,3 +66,4 @@ if __name__ == '__main__':
     opts = UserOptions(args.caselist, args.reacting, args.start_time, args.end_time,
                        args.base_path, args.out_path, args.velocity_component)
     plot(opts)
+    clear_simulation_data_cache()
@@ -9,16 +9,28 @@ Nick Curtis
 from __future__ import division
 
 from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
 import os
+import sys
 from os.path import join as pjoin
 from os.path import pardir as ppardir
 from os.path import isdir as pisdir
+import multiprocessing
 import numpy as np
-import matplotlib.pyplot as plt
+import matplotlib
+# non-interactive backend, such that figures may be saved from child processes
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt  # noqa
+from matplotlib.figure import Figure  # noqa
+from matplotlib.backends.backend_agg import FigureCanvasAgg  # noqa
 plt.rc('text', usetex=True)
 plt.rc('text.latex', preamble=r'\usepackage{amsmath}')
 
 script_dir = os.path.abspath(os.path.dirname(__file__))
+# the axial slices (x/D) sampled in the experiment, in the OpenFOAM graph naming
+axial_points = ('0p375', '0p95', '1p53', '3p75', '9p4')
 
 
 class dimensions(object):
@@ -31,31 +43,50 @@ class dimensions(object):
         self.z_offset = self.trailing_edge  # mm
         self.y_offset = self.height / 2  # mm
         self.z_flip = -1
+        # the (offset, flip, length-scale) normalization of the coordinates
+        self.coordinate_norms = {'y': (self.y_offset, 1, self.D),
+                                 'z': (self.z_offset, self.z_flip, self.D)}
+        # and the axis flips of the velocity components
+        self.velocity_flips = {'Ux': 1, 'Uy': 1, 'Uz': self.z_flip}
+
+
+@lru_cache(maxsize=2)
+def get_dimensions(reacting=False):
+    """
+    Returns the (shared) :class:`dimensions` for the reacting or non-reacting case
+    """
+    return dimensions(reacting)
 
 
 class dataset(object):
-    def __init__(self, columns, data, name, is_simulation=False, time=None):
+    __slots__ = ('columns', 'data', 'name', 'is_simulation', 'time')
+
+    def __init__(self, columns, data, name, is_simulation=False, time=None,
+                 copy=True):
         """
         Attributes
         ----------
         columns: list of str
             The column header names, read from the experimental data
         data: numpy array of shape (len(columns), :attr:`npoints`)
-            The data in the experimental data set
+            The data in the experimental data set, stored in column-major order
+            such that each column is contiguous in memory
         name: str
             The experimental data filename, describing the data within
         is_simulation: bool [False]
             Whether the data is from a simulation or not
+        copy: bool [True]
+            If False, the dataset takes ownership of the supplied columns and data
+            (copied only if required to convert to column-major order), rather
+            than copying them
         """
 
-        self.columns = columns[:]
-        self.data = np.copy(data)
+        self.columns = columns[:] if copy else columns
+        self.data = np.array(data, order='F') if copy else np.asfortranarray(data)
         self.name = name
         self.is_simulation = is_simulation
         self.time = time
 
-        assert len(columns) == data.shape[-1]
-
     @property
     def npoints(self):
         """
@@ -76,55 +107,113 @@ class dataset(object):
     def normalize(self, reacting=False, velocity_power=1.0):
         assert self.is_simulation, "I don't know how to normalize experimental data"
 
-        def _get_slice(i):
-            slicer = [slice(None) for x in self.data.shape]
-            slicer[-1] = i
-            return tuple(slicer)
-
-        dims = dimensions(reacting)
+        # build the per-column offsets, flips and scales, and apply them to all
+        # columns at once (broadcast over the trailing, column axis)
+        dims = get_dimensions(bool(reacting))
+        Ubulk = np.power(dims.Ubulk, velocity_power)
+        flip_velocity = 'fluct' not in self.name
+        offsets = np.zeros(len(self.columns))
+        flips = np.ones(len(self.columns))
+        scales = np.ones(len(self.columns))
         for i, col in enumerate(self.columns):
-            if col in ['y', 'z']:
-                # correct dimensions
-                offset = getattr(dims, '{}_offset'.format(col), 0)
-                self.data[_get_slice(i)] -= offset
-                # flip axes?
-                flip = getattr(dims, '{}_flip'.format(col), 1)
-                self.data[_get_slice(i)] *= flip
-                # normalize
-                self.data[_get_slice(i)] /= dims.D
-            elif col in ['Ux', 'Uy', 'Uz']:
-                axis = col[-1]
-                if 'fluct' not in self.name:
+            if col in dims.coordinate_norms:
+                # correct dimensions, flip axes & normalize
+                offsets[i], flips[i], scales[i] = dims.coordinate_norms[col]
+            elif col in dims.velocity_flips:
+                if flip_velocity:
                     # flip axes?
-                    flip = getattr(dims, '{}_flip'.format(axis), 1)
-                    self.data[_get_slice(i)] *= flip
-                Ubulk = np.power(dims.Ubulk, velocity_power)
+                    flips[i] = dims.velocity_flips[col]
                 # and normalize
-                self.data[_get_slice(i)] /= Ubulk
+                scales[i] = Ubulk
+
+        # (x - offset) * flip / scale == x * slope - intercept
+        slopes = flips / scales
+        intercepts = offsets * slopes
+        np.multiply(self.data, slopes, out=self.data)
+        np.subtract(self.data, intercepts, out=self.data)
 
     def __mul__(self, other):
         assert isinstance(other, dataset)
         assert self.is_simulation == other.is_simulation
         assert np.array_equal(self.time, other.time)
-        data = self.data.copy()
+        data = self.data.copy(order='F')
         slicer = [slice(None) for x in data.shape]
         slicer[-1] = slice(1, data.shape[-1])
         slicer = tuple(slicer)
         data[slicer] *= other.data[slicer]
-        return dataset(self.columns, data,
+        return dataset(self.columns[:], data,
                        '{} x {}'.format(self.name, other.name),
-                       self.is_simulation, time=self.time)
+                       self.is_simulation, time=self.time, copy=False)
 
 
 class PlotStyles(object):
     def __init__(self, cases, grey=False):
         self.num_colors = len(cases) + 1  # for experimental data
         self.grey = grey
-
-    @property
-    def color_map(self):
+        # sample the colormap once, rather than on every color lookup
         cmap = 'Greys' if self.grey else 'inferno'
-        return plt.get_cmap(cmap, self.num_colors + 1)
+        self.color_map = plt.get_cmap(cmap, self.num_colors + 1)
+        self.colors = [tuple(c) for c in
+                       self.color_map(np.arange(self.num_colors + 1))]
+
+
+class AsyncPlotter(object):
+    """
+    Saves figures in a single, long-lived background process, such that the
+    rendering / writing of a figure overlaps with the construction of the next.
+    On Linux, the worker is forked (once, on the first save) rather than spawned,
+    such that it does not have to re-import numpy / scipy / matplotlib
+    """
+
+    def __init__(self):
+        if sys.platform.startswith('linux'):
+            context = multiprocessing.get_context('fork')
+        else:
+            # fork is unavailable on Windows, and unsafe on macOS
+            context = multiprocessing.get_context()
+        self.pool = ProcessPoolExecutor(max_workers=1, mp_context=context)
+        self.futures = []
+
+    def save(self, fig, filename, **kwargs):
+        self.futures.append((self.pool.submit(fig.savefig, filename, **kwargs),
+                             filename))
+
+    def join(self):
+        failed = []
+        for future, filename in self.futures:
+            exc = future.exception()
+            if exc is not None:
+                failed.append((filename, exc))
+        self.futures = []
+        if failed:
+            reasons = ['{}: {}: {}'.format(filename, type(exc).__name__, exc)
+                       for filename, exc in failed]
+            # and chain the first failure, such that its traceback is kept
+            raise Exception('Saving figure(s) failed:\n{}'.format(
+                '\n'.join(reasons))) from failed[0][1]
+
+    def close(self):
+        try:
+            self.join()
+        finally:
+            self.pool.shutdown()
+
+
+@contextmanager
+def figure_saver(saver=None):
+    """
+    Yields the supplied :class:`AsyncPlotter`, or if None, a new one that is
+    joined & shut down on exit.  On a single core there is nothing for the saves
+    to overlap with, hence None is yielded and the figures are saved inline
+    """
+    if saver is not None or (os.cpu_count() or 1) < 2:
+        yield saver
+        return
+    saver = AsyncPlotter()
+    try:
+        yield saver
+    finally:
+        saver.close()
 
 
 class UserOptions(object):
@@ -152,6 +241,8 @@ class UserOptions(object):
 
         # plot styles
         self.style = PlotStyles(self.cases)
+        # graph directories of each case, filled on first use
+        self._graph_paths = {}
 
     @property
     def ncases(self):
@@ -161,18 +252,29 @@ class UserOptions(object):
         """
         Return the path to a simulation graph directory
         """
-        path = pjoin(self.base_path, case, 'postProcessing', graph_name)
-        path = os.path.abspath(path)
-
-        if not pisdir(path):
+        if case not in self._graph_paths:
+            # scan the case's postProcessing directory once, rather than checking
+            # each graph's directory individually
+            post_path = os.path.abspath(
+                pjoin(self.base_path, case, 'postProcessing'))
+            graphs = {}
+            if pisdir(post_path):
+                for entry in os.scandir(post_path):
+                    if entry.is_dir():
+                        graphs[entry.name] = pjoin(post_path, entry.name)
+            self._graph_paths[case] = graphs
+
+        try:
+            return self._graph_paths[case][graph_name]
+        except KeyError:
+            path = os.path.abspath(
+                pjoin(self.base_path, case, 'postProcessing', graph_name))
             raise Exception('Graph {} for case {} {} not found, {} is not a valid '
                             'directory'.format(
                                 graph_name,
                                 'reacting' if self.reacting else 'non-reacting',
                                 case, path))
 
-        return path
-
     def make_dir(self, case):
         import os
         if not os.path.exists(pjoin(self.out_path, case)):
@@ -189,7 +291,7 @@ class UserOptions(object):
         return [pjoin(self.base_path, case) for case in self.cases]
 
     def color(self, caseno, exp=False):
-        return self.style.color_map(caseno + 1 if not exp else 0)
+        return self.style.colors[caseno + 1 if not exp else 0]
 
     def linestyle(self, caseno, exp=False):
         if exp:
@@ -203,7 +305,8 @@ class Plot(object):
                  label_names={},
                  exp_name=None,
                  sharey=False,
-                 sharex=False):
+                 sharex=False,
+                 saver=None):
         base_label_names = {'mean': 'Simulation',
                             'U': r'$u/U_{\text{bulk}}$',
                             'V': r'$v/U_{\text{bulk}}$',
@@ -229,8 +332,12 @@ class Plot(object):
         self.label_names = base_label_names.copy()
         self.sharex = sharex
         self.sharey = sharey
+        self.saver = saver
         self.axes = []
-        self.fig = plt.figure(figsize=self.figsize())
+        # use a stand-alone figure rather than pyplot's global figure registry,
+        # such that the figure is released once we're done with it
+        self.fig = Figure(figsize=self.figsize())
+        FigureCanvasAgg(self.fig)
 
     @property
     def multiplot(self):
@@ -238,7 +345,7 @@ class Plot(object):
 
     @property
     def gca(self):
-        return self.axes[-1] if self.multiplot else plt.gca()
+        return self.axes[-1] if self.multiplot else self.fig.gca()
 
     @property
     def num_plots(self):
@@ -274,6 +381,25 @@ class Plot(object):
                       **self.get_plotargs(simdata.name, caseno, case,
                                           hold=kwargs.get('hold', None)))
 
+    def prefetch(self, points, **kwargs):
+        """
+        Concurrently reads the simulation data of all cases at the given points,
+        such that the subsequent (serial) plotting is served from the cache
+        """
+        from read_simulation_data import load_simulation_data
+        tasks = [(case, self.sim_name(point=point))
+                 for case in self.opts.cases for point in points]
+        # one thread per graph would grow with the number of cases, hence cap
+        # the pool as the ThreadPoolExecutor default does
+        workers = min(len(tasks), 32, (os.cpu_count() or 1) + 4)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(load_simulation_data, case, sim_name,
+                                   self.opts, **kwargs)
+                       for case, sim_name in tasks]
+            # and raise any error encountered while reading
+            for future in futures:
+                future.result()
+
     def sim_name(self, **kwargs):
         return self._sim_name
 
@@ -333,9 +459,12 @@ class Plot(object):
                             borderaxespad=0, ncol=4, fontsize=legend_font,
                             labelspacing=8)
         self.fig.tight_layout()
-        self.fig.savefig(pjoin(self.opts.out_path, self.figname()),
-                         bbox_inches="tight")
-        plt.close(self.fig)
+        if self.saver is not None:
+            self.saver.save(self.fig, pjoin(self.opts.out_path, self.figname()),
+                            bbox_inches="tight")
+        else:
+            self.fig.savefig(pjoin(self.opts.out_path, self.figname()),
+                             bbox_inches="tight")
 
     def figname(self):
         raise NotImplementedError
@@ -1,18 +1,18 @@
-import matplotlib.pyplot as plt
-
-from read_simulation_data import read_simulation_data
-from common import get_default_parsing_args, UserOptions, Plot
+from read_simulation_data import read_simulation_data, \
+    clear_simulation_data_cache
+from common import get_default_parsing_args, UserOptions, Plot, \
+    axial_points
 
 
 class FluctuationVelocityPlot(Plot):
     base_sim_name = 'axialDeficitPlot_{point}'
     base_exp_name = 'fluctuationVelocity'
 
-    def __init__(self, opts, velocity_component, num_points):
+    def __init__(self, opts, velocity_component, num_points, saver=None):
         super(FluctuationVelocityPlot, self).__init__(
             FluctuationVelocityPlot.base_sim_name, opts,
             exp_name=FluctuationVelocityPlot.base_exp_name,
-            sharey=num_points)
+            sharey=num_points, saver=saver)
         self.velocity_component = velocity_component
 
     def figname(self):
@@ -51,15 +51,15 @@ class FluctuationVelocityPlot(Plot):
                                      baseline=baseline)
         # normalize / convert simulation data
         fluct.normalize(self.opts.reacting)
-        plt.plot(fluct[:, 1], fluct[:, 0], **self.get_plotargs(
-                 baseline.name, caseno, case, hold=kwargs.get('hold', None)))
+        self.gca.plot(fluct[:, 1], fluct[:, 0], **self.get_plotargs(
+                      baseline.name, caseno, case, hold=kwargs.get('hold', None)))
 
 
-def plot(opts):
-    points = ['0p375', '0p95', '1p53', '3p75', '9p4']
+def plot(opts, saver=None):
     for vc in opts.velocity_component:
-        fvp = FluctuationVelocityPlot(opts, vc, len(points))
-        for i, point in enumerate(points):
+        fvp = FluctuationVelocityPlot(opts, vc, len(axial_points), saver=saver)
+        fvp.prefetch(axial_points, velocity_component=vc)
+        for i, point in enumerate(axial_points):
             fvp.plot(point=point, velocity_component=vc, hold=i)
         fvp.finalize(point=point)
 
@@ -80,3 +80,4 @@ if __name__ == '__main__':
                        args.base_path, args.out_path, args.velocity_component)
 
     plot(opts)
+    clear_simulation_data_cache()
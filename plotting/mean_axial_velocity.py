@@ -1,3 +1,4 @@
+from read_simulation_data import clear_simulation_data_cache
 from common import get_default_parsing_args, UserOptions, Plot
 
 graph_name = 'meanAxialVelocity'
@@ -6,10 +7,11 @@ graph_name = 'meanAxialVelocity'
 class MeanAxialVelocityPlot(Plot):
     graph_name = 'meanAxialVelocity'
 
-    def __init__(self, opts):
+    def __init__(self, opts, saver=None):
         super(MeanAxialVelocityPlot, self).__init__(
             MeanAxialVelocityPlot.graph_name, opts,
-            label_names={'U': 'Normalized Centerline Axial Velocity'})
+            label_names={'U': 'Normalized Centerline Axial Velocity'},
+            saver=saver)
 
     def figname(self):
         return 'mean_axial_velocity.pdf'
@@ -24,8 +26,8 @@ class MeanAxialVelocityPlot(Plot):
         return ""
 
 
-def plot(opts):
-    MeanAxialVelocityPlot(opts).plot()
+def plot(opts, saver=None):
+    MeanAxialVelocityPlot(opts, saver=saver).plot()
 
 
 if __name__ == '__main__':
@@ -39,3 +41,4 @@ if __name__ == '__main__':
     opts = UserOptions(args.caselist, args.reacting, args.start_time, args.end_time,
                        args.base_path, args.out_path)
     plot(opts)
+    clear_simulation_data_cache()
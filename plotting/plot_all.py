@@ -1,5 +1,6 @@
 
-from common import get_default_parsing_args, UserOptions
+from common import get_default_parsing_args, UserOptions, figure_saver
+from read_simulation_data import clear_simulation_data_cache
 from fluctuation_velocity_plots import plot as fplot
 from mean_axial_velocity import plot as mplot
 from axial_deficit_plots import plot as aplot
@@ -13,7 +14,13 @@ if __name__ == '__main__':
             'Generates all plots for the given case.')
 
     args = parser.parse_args()
-    for plot in plotters:
-        opts = UserOptions(args.caselist, args.reacting, args.start_time,
-                           args.end_time, args.base_path, args.out_path)
-        plot(opts)
+    # save all figures in the background (if multiple cores are available),
+    # while the next plot is generated
+    with figure_saver() as saver:
+        for plot in plotters:
+            opts = UserOptions(args.caselist, args.reacting, args.start_time,
+                               args.end_time, args.base_path, args.out_path)
+            plot(opts, saver=saver)
+    # the plotters share the cached simulation data, hence clear it only once
+    # all are done
+    clear_simulation_data_cache()
@@ -1,5 +1,6 @@
 import os
 import re
+from functools import lru_cache
 import numpy as np
 
 from common import dataset
@@ -9,6 +10,36 @@ non_reacting_path = os.path.join(script_dir, 'Experimental', 'Non-Reacting')
 reacting_path = os.path.join(script_dir, 'Experimental', 'Reacting')
 
 
+@lru_cache(maxsize=64)
+def _parse_file(filename, reacting=False):
+    """
+    Parses the column names and (read-only) data of an experimental file.  The
+    results are cached, such that repeated plots of the same experimental data
+    only read the file once.
+    """
+
+    path = reacting_path if reacting else non_reacting_path
+    with open(os.path.join(path, filename)) as file:
+        file = file.readlines()
+
+    # read column names
+    comment = re.compile(r'^\s*#')
+    column_names = re.compile(r'^\s*#\s*(.+)\s*,\s*(.+)\s*$')
+    for i in range(1, len(file) - 1):
+        if comment.search(file[i - 1]) and column_names.search(file[i]) and \
+                not comment.search(file[i + 1]):
+            # this is the column header
+            columns = column_names.search(file[i]).groups()[::-1]
+            break
+
+    # and parse the data from the lines already read, rather than re-opening
+    data = np.loadtxt(file, delimiter=',')[:, ::-1]
+    data.setflags(write=False)
+    assert len(columns) == data.shape[-1]
+
+    return columns, data
+
+
 def read_file(filename, reacting=False):
     """
     Reads experimental from a file
@@ -26,22 +57,8 @@ def read_file(filename, reacting=False):
         The resulting dataset
     """
 
-    path = reacting_path if reacting else non_reacting_path
-    data = np.loadtxt(os.path.join(path, filename), delimiter=',')[:, ::-1]
-
-    # read column names
-    comment = re.compile(r'^\s*#')
-    column_names = re.compile(r'^\s*#\s*(.+)\s*,\s*(.+)\s*$')
-    with open(os.path.join(path, filename)) as file:
-        file = file.readlines()
-
-    for i in range(1, len(file) - 1):
-        if comment.search(file[i - 1]) and column_names.search(file[i]) and \
-                not comment.search(file[i + 1]):
-            # this is the column header
-            columns = column_names.search(file[i]).groups()[::-1]
-            break
-
+    # the dataset copies the cached data, hence it may be safely modified
+    columns, data = _parse_file(filename, bool(reacting))
     return dataset(columns, data, filename[filename.index('_') + 1:])
 
 
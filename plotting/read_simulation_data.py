@@ -15,6 +15,7 @@ from os import listdir as plistdir
 from os.path import isfile as pisfile
 from os.path import isdir as pisdir
 from os.path import basename as pasename
+from functools import lru_cache
 
 from scipy.integrate import simps, trapz
 import numpy as np
@@ -113,6 +114,106 @@ class dummy(object):
         return data
 
 
+@lru_cache(maxsize=None)
+def _read_graph(path, graph_name, efile, use_columns, t_start, t_end):
+    """
+    Reads the raw data for all time directories of a simulation graph within the
+    given time window.  The results are cached, such that repeated plots of the
+    same graph (e.g., the mean & fluctuation velocities) parse the OpenFOAM
+    postProcessing files only once.  The cache is unbounded, such that it can
+    hold everything a :meth:`Plot.prefetch` reads, and is released via
+    :func:`clear_simulation_data_cache`.
+
+    Returns
+    -------
+    time: :class:`numpy.ndarray`
+        The (read-only) times read
+    complete_data: :class:`numpy.ndarray`
+        The (read-only) data for each time, of shape
+        (len(time), npoints, len(use_columns))
+    skipped: tuple of str
+        Diagnostics for the directories skipped while reading.  These are
+        returned rather than printed, as the graphs may be read concurrently
+    """
+
+    datalist = []
+    timelist = []
+    skipped = []
+    for time_dir in sorted([pjoin(path, x) for x in plistdir(path)
+                           if pisdir(pjoin(path, x))]):
+        # check that it's a valid time directory
+        try:
+            time = float(pasename(time_dir))
+            if time < t_start or (t_end > 0 and time > t_end):
+                # out of range
+                continue
+        except ValueError:
+            skipped.append(
+                'Skipping directory {} for graph {}, not a time-directory'.format(
+                    pasename(time_dir), graph_name))
+            continue
+        # get file list
+        files = [pjoin(time_dir, x) for x in plistdir(time_dir)
+                 if pisfile(pjoin(time_dir, x))]
+        if len(files) > 1:
+            raise NotImplementedError
+        elif not len(files):
+            raise Exception("Time directory {} has no post-procesing file".format(
+                time_dir))
+        # open file
+        file = files[0]
+        base = pasename(file)
+        if base != efile:
+            raise Exception('File type {} for graph type {} unexpected'.format(
+                base, graph_name))
+
+        # read file
+        data = np.loadtxt(file, usecols=use_columns)
+        if not data.size:
+            skipped.append('Data for time directory {} empty, skipping.'.format(
+                time))
+            continue
+        datalist.append(data)
+        timelist.append(time)
+
+    # sanity check -- ensure all data is same shape
+    assert np.all([x.shape == datalist[0].shape for x in datalist])
+
+    # check time is ordered
+    assert np.all([timelist[i + 1] > timelist[i] for i in range(len(timelist) - 1)])
+
+    # ensure we have same times and data
+    assert len(timelist) == len(datalist)
+
+    time = np.array(timelist)
+    complete_data = np.array(datalist)
+    # the result is shared between callers via the cache, hence make it read-only
+    time.setflags(write=False)
+    complete_data.setflags(write=False)
+    return time, complete_data, tuple(skipped)
+
+
+def load_simulation_data(case, graph_name, opts, **kwargs):
+    """
+    Reads the raw (not time-averaged) data for a given case and graph, see
+    :func:`_read_graph`.  The results are cached, hence this may be used to
+    pre-load the data for subsequent calls to :func:`read_simulation_data`
+    """
+
+    path = opts.get_simulation_path(case, graph_name)
+    efile, _, use_columns = get_graph_columns(graph_name, **kwargs)
+    return _read_graph(path, graph_name, efile, use_columns,
+                       opts.t_start, opts.t_end)
+
+
+def clear_simulation_data_cache():
+    """
+    Releases the raw simulation data cached by :func:`load_simulation_data`
+    """
+
+    _read_graph.cache_clear()
+
+
 def read_simulation_data(case, graph_name, opts,
                          collection_type='mean', collection_method='simps',
                          baseline=None, **kwargs):
@@ -176,60 +277,13 @@ def read_simulation_data(case, graph_name, opts,
     else:
         raise Exception('Unknown collection method: {}'.format(collection_method))
 
-    path = opts.get_simulation_path(case, graph_name)
-    efile, columns, use_columns = get_graph_columns(graph_name, **kwargs)
-
-    datalist = []
-    timelist = []
-    for time_dir in sorted([pjoin(path, x) for x in plistdir(path)
-                           if pisdir(pjoin(path, x))]):
-        # check that it's a valid time directory
-        try:
-            time = float(pasename(time_dir))
-            if time < opts.t_start or (opts.t_end > 0 and time > opts.t_end):
-                # out of range
-                continue
-        except ValueError:
-            print('Skipping directory {} for graph {}, not a time-directory'.format(
-                pasename(time_dir), graph_name))
-            continue
-        # get file list
-        files = [pjoin(time_dir, x) for x in plistdir(time_dir)
-                 if pisfile(pjoin(time_dir, x))]
-        if len(files) > 1:
-            raise NotImplementedError
-        elif not len(files):
-            raise Exception("Time directory {} has no post-procesing file".format(
-                time_dir))
-        # open file
-        file = files[0]
-        base = pasename(file)
-        if base != efile:
-            raise Exception('File type {} for graph type {} unexpected'.format(
-                base, graph_name))
-
-        # read file
-        data = np.loadtxt(file, usecols=use_columns)
-        if not data.size:
-            print('Data for time directory {} empty, skipping.'.format(
-                time))
-            continue
-        datalist.append(data)
-        timelist.append(time)
-
-    # sanity check -- ensure all data is same shape
-    assert np.all([x.shape == datalist[0].shape for x in datalist])
-
-    # check time is ordered
-    assert np.all([timelist[i + 1] > timelist[i] for i in range(len(timelist) - 1)])
-
-    # ensure we have same times and data
-    assert len(timelist) == len(datalist)
+    _, columns, _ = get_graph_columns(graph_name, **kwargs)
+    time, complete_data, skipped = load_simulation_data(
+        case, graph_name, opts, **kwargs)
+    for message in skipped:
+        print(message)
 
     # finally, average the data over time
-    time = np.array(timelist)
-    complete_data = np.array(datalist)
-
     def slicer(var):
         if collection_method in ['fluct', 'none']:
             return (slice(None), slice(None), var)
@@ -237,7 +291,7 @@ def read_simulation_data(case, graph_name, opts,
             return (slice(None), var)
 
     final_data = np.zeros(complete_data.shape if collection_method in [
-                          'fluct', 'none'] else complete_data.shape[1:])
+                          'fluct', 'none'] else complete_data.shape[1:], order='F')
     # simply copy in coordinate axes
     assert np.all(np.array_equal(x[:, 0], complete_data[0, :, 0])
                   for x in complete_data)
@@ -246,5 +300,6 @@ def read_simulation_data(case, graph_name, opts,
     for var in range(1, complete_data.shape[2]):
         # get collected data
         final_data[slicer(var)] = collector(complete_data[:, :, var], time, axis=0)
+    assert len(columns) == final_data.shape[-1]
     return dataset(columns, final_data, collection_type, is_simulation=True,
-                   time=time)
+                   time=time, copy=False)
@@ -1,19 +1,20 @@
-import matplotlib.pyplot as plt
 import numpy as np
 
-from read_simulation_data import read_simulation_data, integration_averager
-from common import get_default_parsing_args, UserOptions, Plot, dataset
+from read_simulation_data import read_simulation_data, integration_averager, \
+    clear_simulation_data_cache
+from common import get_default_parsing_args, UserOptions, Plot, \
+    dataset, axial_points
 
 
 class ReynoldsStressPlot(Plot):
     base_sim_name = 'axialDeficitPlot_{point}'
     base_exp_name = 'reynoldsStress'
 
-    def __init__(self, opts, num_points):
+    def __init__(self, opts, num_points, saver=None):
         super(ReynoldsStressPlot, self).__init__(
             ReynoldsStressPlot.base_sim_name, opts,
             exp_name=ReynoldsStressPlot.base_exp_name,
-            sharey=num_points)
+            sharey=num_points, saver=saver)
         self.velocity_components = ['z', 'y']
 
     def figname(self):
@@ -57,27 +58,29 @@ class ReynoldsStressPlot(Plot):
             integration_averager()(Uy.data[:, :, 1], Uy.time)
 
         # mean(u'v') = mean(uv) - mean(u)mean(v)
-        vals = np.zeros(Ux.data.shape[1:])
+        vals = np.zeros(Ux.data.shape[1:], order='F')
         vals[:, 0] = Ux.data[0, :, 0]
         vals[:, 1] = Uxy_mean - Ux_Uy_mean
 
         # normalize / convert simulation data twice (for the squared velocity)
-        from common import dimensions
-        dim = dimensions(self.opts.reacting)
+        from common import get_dimensions
+        dim = get_dimensions(bool(self.opts.reacting))
         vals[:, 1] /= (dim.Ubulk * dim.Ubulk)
 
         to_plot = dataset(Ux.columns[:], vals, Ux.name,
-                          is_simulation=Ux.is_simulation, time=Ux.time)
+                          is_simulation=Ux.is_simulation, time=Ux.time,
+                          copy=False)
         # and plot
-        plt.plot(to_plot[:, 1], to_plot[:, 0],
-                 **self.get_plotargs(Ux.name, caseno, case,
-                                     hold=kwargs.get('hold', None)))
+        self.gca.plot(to_plot[:, 1], to_plot[:, 0],
+                      **self.get_plotargs(Ux.name, caseno, case,
+                                          hold=kwargs.get('hold', None)))
 
 
-def plot(opts):
-    points = ['0p375', '0p95', '1p53', '3p75', '9p4']
-    fvp = ReynoldsStressPlot(opts, len(points))
-    for i, point in enumerate(points):
+def plot(opts, saver=None):
+    fvp = ReynoldsStressPlot(opts, len(axial_points), saver=saver)
+    for vc in fvp.velocity_components:
+        fvp.prefetch(axial_points, velocity_component=vc)
+    for i, point in enumerate(axial_points):
         fvp.plot(point=point, hold=i)
     fvp.finalize(point=point)
 
@@ -93,3 +96,4 @@ if __name__ == '__main__':
                        args.base_path, args.out_path)
 
     plot(opts)
+    clear_simulation_data_cache()